@@ -44,6 +44,14 @@ def load_data():
 
 df = load_data()
 
+@st.cache_data
+def get_data_fingerprint():
+    # 以資料內容的雜湊值作為快取鍵，讓預測等較重的計算只在資料變動時重新執行
+    data = load_data()
+    if data is None:
+        return None
+    return int(pd.util.hash_pandas_object(data, index=False).sum())
+
 # --- 圖表生成函式 ---
 def create_heatmap(filtered_df, title_text, heatmap_mode, use_log_scale, heatmap_order):
     pivot_df = pd.pivot_table(
@@ -264,6 +272,227 @@ def create_deterioration_heatmap(df_deterioration, metric_name):
         )
     return fig
 
+# --- 案件帳齡歷史 (馬可夫預測與月對月異動共用) ---
+def _sorted_case_history(df):
+    # 每個案件每月只保留一筆，依案件、月份排序
+    # 同時回傳 has_previous：該列的前一列是否為同一案件、且剛好是上一個月份
+    # 馬可夫移轉次數與月對月異動索引都以此判斷「相鄰月份」，避免兩者定義不一致
+    history = df[['案件編號', '合約日期', '月份', '帳齡']].drop_duplicates(subset=['案件編號', '月份'], keep='last')
+    history = history.sort_values(['案件編號', '月份']).reset_index(drop=True)
+
+    month_index = (history['月份'].dt.year * 12 + history['月份'].dt.month).to_numpy()
+    case_ids = history['案件編號'].to_numpy()
+    has_previous = np.zeros(len(history), dtype=bool)
+    has_previous[1:] = (case_ids[1:] == case_ids[:-1]) & (month_index[1:] - month_index[:-1] == 1)
+    return history, has_previous
+
+# --- 馬可夫鏈帳齡移轉預測 ---
+MARKOV_BOOTSTRAP_BATCH_SIZE = 100 # 每批次同時計算的 bootstrap 樣本數，用於控制記憶體用量
+
+def _normalize_transition_counts(counts):
+    # 將移轉次數轉為機率；沒有任何觀測值的帳齡則假設維持原狀 (對角線為 1)
+    totals = counts.sum(axis=-1, keepdims=True)
+    identity = np.broadcast_to(np.eye(counts.shape[-1]), counts.shape)
+    return np.where(totals > 0, counts / np.where(totals > 0, totals, 1), identity)
+
+def _transition_matrix_powers(transition_matrix, horizon):
+    # 計算 P^0 ~ P^horizon，支援批次矩陣 (..., S, S)，回傳 (..., horizon + 1, S, S)
+    n_states = transition_matrix.shape[-1]
+    powers = np.empty(transition_matrix.shape[:-2] + (horizon + 1, n_states, n_states))
+    powers[..., 0, :, :] = np.eye(n_states)
+    for step in range(1, horizon + 1):
+        powers[..., step, :, :] = powers[..., step - 1, :, :] @ transition_matrix
+    return powers
+
+def _project_delay_rates(cohort_distributions, transition_matrix, delay_mask, horizon):
+    # 一次計算所有同期群在未來各月份的延滯比例，回傳 (..., 同期群數, horizon + 1)
+    delay_by_step = _transition_matrix_powers(transition_matrix, horizon) @ delay_mask
+    return np.einsum('cs,...ks->...ck', cohort_distributions, delay_by_step)
+
+@st.cache_data
+def estimate_markov_transitions(_df, data_fingerprint):
+    # 由相鄰兩個月份的帳齡變化估計移轉次數，並整理各合約月份在最後觀測月份的帳齡分佈
+    # data_fingerprint 僅作為快取鍵使用
+    states = list(_df['帳齡'].cat.categories)
+    n_states = len(states)
+
+    history, has_previous = _sorted_case_history(_df)
+    state_codes = history['帳齡'].cat.codes.to_numpy()
+
+    # 只採用同一案件、且剛好相隔一個月的觀測值
+    to_rows = np.flatnonzero(has_previous)
+    from_codes = state_codes[to_rows - 1]
+    to_codes = state_codes[to_rows]
+    counts = np.bincount(from_codes * n_states + to_codes, minlength=n_states * n_states).reshape(n_states, n_states).astype(float)
+
+    # 每個合約月份的起始分佈：該同期群最後一個觀測月份的帳齡案件數
+    history = history.assign(合約月份=history['合約日期'].dt.strftime('%Y/%m'))
+    last_month = history.groupby('合約月份')['月份'].transform('max')
+    latest = history[history['月份'] == last_month]
+    cohort_counts = pd.crosstab(latest['合約月份'], latest['帳齡'], dropna=False).reindex(columns=states, fill_value=0)
+    cohort_last_month = latest.groupby('合約月份')['月份'].max().reindex(cohort_counts.index)
+
+    return counts, states, cohort_counts, cohort_last_month
+
+@st.cache_data
+def project_markov_delay(_df, data_fingerprint, delay_categories, horizon, n_bootstrap, confidence_level):
+    # 以馬可夫鏈預測各合約月份未來 horizon 個月的延滯比例，並以 bootstrap 計算信賴區間
+    # 快取鍵包含資料指紋與延滯定義 (delay_categories 需為 tuple)
+    counts, states, cohort_counts, cohort_last_month = estimate_markov_transitions(_df, data_fingerprint)
+
+    cohort_sizes = cohort_counts.sum(axis=1).to_numpy().astype(float)
+    cohort_distributions = cohort_counts.to_numpy() / np.where(cohort_sizes > 0, cohort_sizes, 1)[:, None]
+    delay_mask = np.isin(states, delay_categories).astype(float)
+
+    point_estimate = _project_delay_rates(cohort_distributions, _normalize_transition_counts(counts), delay_mask, horizon)
+
+    # Bootstrap：依各起始帳齡的觀測次數，重新抽樣移轉結果，分批向量化計算
+    rng = np.random.default_rng(0)
+    row_totals = counts.sum(axis=1).astype(np.int64)
+    transition_matrix = _normalize_transition_counts(counts)
+    n_states = len(states)
+    bootstrap_rates = []
+    for batch_start in range(0, n_bootstrap, MARKOV_BOOTSTRAP_BATCH_SIZE):
+        batch_size = min(MARKOV_BOOTSTRAP_BATCH_SIZE, n_bootstrap - batch_start)
+        resampled_counts = rng.multinomial(row_totals, transition_matrix, size=(batch_size, n_states)).astype(float)
+        bootstrap_rates.append(
+            _project_delay_rates(cohort_distributions, _normalize_transition_counts(resampled_counts), delay_mask, horizon)
+        )
+    bootstrap_rates = np.concatenate(bootstrap_rates, axis=0)
+    tail = (100 - confidence_level) / 2
+    lower, upper = np.percentile(bootstrap_rates, [tail, 100 - tail], axis=0)
+
+    n_cohorts = len(cohort_counts)
+    steps = np.tile(np.arange(horizon + 1), n_cohorts)
+    last_months = np.repeat(cohort_last_month.to_numpy(), horizon + 1)
+    projection = pd.DataFrame({
+        '合約月份': np.repeat(cohort_counts.index.to_numpy(), horizon + 1),
+        '預測月數': steps,
+        '月份': [month + pd.DateOffset(months=int(step)) for month, step in zip(last_months, steps)],
+        '案件數': np.repeat(cohort_sizes.astype(int), horizon + 1),
+        '延滯比例': point_estimate.ravel() * 100,
+        '延滯比例下界': lower.ravel() * 100,
+        '延滯比例上界': upper.ravel() * 100,
+    })
+    transition_df = pd.DataFrame(_normalize_transition_counts(counts) * 100, index=states, columns=states)
+    return projection, transition_df
+
+def create_markov_projection_chart(filtered_df, title_text, metric_name, confidence_level):
+    fig = go.Figure()
+    colors = px.colors.qualitative.Plotly
+    for i, (cohort, cohort_df) in enumerate(filtered_df.groupby('合約月份', sort=True)):
+        color = colors[i % len(colors)]
+        # 信賴區間：以上界與反向的下界組成封閉區域
+        fig.add_trace(go.Scatter(
+            x=list(cohort_df['月份']) + list(cohort_df['月份'][::-1]),
+            y=list(cohort_df['延滯比例上界']) + list(cohort_df['延滯比例下界'][::-1]),
+            fill='toself', fillcolor=color, opacity=0.2, line=dict(width=0),
+            hoverinfo='skip', showlegend=False, legendgroup=cohort
+        ))
+        fig.add_trace(go.Scatter(
+            x=cohort_df['月份'], y=cohort_df['延滯比例'], mode='lines+markers',
+            name=cohort, legendgroup=cohort, line=dict(color=color),
+            customdata=cohort_df[['延滯比例下界', '延滯比例上界', '預測月數']],
+            hovertemplate=f"{cohort}: %{{y:.2f}}% ({confidence_level}% 區間 %{{customdata[0]:.2f}}% ~ %{{customdata[1]:.2f}}%, 第 %{{customdata[2]}} 個月)<extra></extra>"
+        ))
+    fig.update_layout(
+        title_text=title_text,
+        yaxis_title=metric_name,
+        legend_title_text='合約月份'
+    )
+    return fig
+
+# --- 月對月帳齡異動索引 ---
+CHANGE_TYPE_ORDER = ['惡化', '轉正常', '改善', '新進', '重新出現']
+CURRENT_AGING = ['Normal', 'M0'] # 視為正常繳款 (未逾期) 的帳齡
+CHANGE_TYPE_COLORS = {'惡化': '#d62728', '轉正常': '#2ca02c', '改善': '#98df8a', '新進': '#1f77b4', '重新出現': '#9467bd'}
+
+@st.cache_resource
+def build_case_change_index(_df, data_fingerprint):
+    # 每次載入資料只建立一次：比較每個案件與前一次出現時的帳齡，記錄異動方向與級距變化
+    # 異動類型：
+    #   惡化     - 與上個月相比帳齡級距上升
+    #   轉正常   - 上個月為逾期 (M1 以上)，本月回到 Normal/M0
+    #   改善     - 帳齡級距下降但不屬於轉正常 (仍逾期，或 M0 -> Normal)
+    #   新進     - 案件第一次出現在資料中
+    #   重新出現 - 上個月沒有資料，但之前曾經出現過 (與最後一次出現時的帳齡比較)
+    # 索引為唯讀共用物件 (cache_resource 不會每次重新複製)，依月份排序並記錄各月份的位置，
+    # 之後的篩選與分頁只需切出單一月份的片段，不必重新掃描整份資料
+    history, has_previous = _sorted_case_history(_df)
+
+    # 帳齡類別依嚴重程度由高到低排列，轉換為 Normal=0、M0=1 ... M6+=最大值 的級距
+    severity = (len(history['帳齡'].cat.categories) - 1 - history['帳齡'].cat.codes).to_numpy()
+    month_index = (history['月份'].dt.year * 12 + history['月份'].dt.month).to_numpy()
+    # 新進與否以案件第一次出現判斷，避免某個月份缺檔時，下個月所有案件都被視為新進
+    first_seen = (history.groupby('案件編號').cumcount() == 0).to_numpy()
+    is_current = history['帳齡'].isin(CURRENT_AGING).to_numpy()
+
+    # 前一列即為同一案件前一次出現的紀錄 (一般為上個月，重新出現的案件則為最後一次出現的月份)
+    previous_severity = np.roll(severity, 1)
+    previous_current = np.roll(is_current, 1)
+    bucket_delta = np.where(first_seen, 0, severity - previous_severity)
+
+    change_type = np.select(
+        [first_seen, ~has_previous, bucket_delta > 0, ~previous_current & is_current, bucket_delta < 0],
+        ['新進', '重新出現', '惡化', '轉正常', '改善'],
+        default='持平'
+    )
+    previous_aging = history['帳齡'].shift(1).where(~first_seen)
+
+    # 資料中的第一個月份沒有上個月可比較，不列入索引；持平的案件也不需要保留
+    keep = (change_type != '持平') & (month_index > month_index.min())
+    change_index = pd.DataFrame({
+        '月份': history['月份'],
+        '異動類型': change_type,
+        '案件編號': history['案件編號'],
+        '合約月份': history['合約日期'].dt.strftime('%Y/%m'),
+        '前次帳齡': previous_aging,
+        '帳齡': history['帳齡'],
+        '帳齡變化': bucket_delta,
+    })[keep]
+    change_index['異動類型'] = pd.Categorical(change_index['異動類型'], categories=CHANGE_TYPE_ORDER, ordered=True)
+
+    # 月份 -> 異動類型 -> 變化幅度由大到小 排序，讓每個月份的片段可直接分頁顯示
+    change_index = change_index.assign(_abs_delta=np.abs(change_index['帳齡變化']))
+    change_index = change_index.sort_values(
+        ['月份', '異動類型', '_abs_delta', '案件編號'],
+        ascending=[True, True, False, True]
+    ).drop(columns='_abs_delta').reset_index(drop=True)
+
+    months = change_index['月份'].to_numpy()
+    unique_months = np.unique(months)
+    starts = np.searchsorted(months, unique_months, side='left')
+    stops = np.searchsorted(months, unique_months, side='right')
+    month_bounds = {pd.Timestamp(m): (start, stop) for m, start, stop in zip(unique_months, starts, stops)}
+
+    monthly_summary = pd.crosstab(change_index['月份'], change_index['異動類型'], dropna=False).reindex(columns=CHANGE_TYPE_ORDER, fill_value=0)
+    return change_index, month_bounds, monthly_summary
+
+def get_month_movers(change_index, month_bounds, month, change_types, aging_filter, min_delta):
+    # 只切出指定月份的片段後再篩選，不會重新掃描整份索引
+    start, stop = month_bounds.get(month, (0, 0))
+    movers = change_index.iloc[start:stop]
+    mask = movers['異動類型'].isin(change_types) & (movers['帳齡變化'].abs() >= min_delta)
+    if aging_filter:
+        mask &= movers['帳齡'].isin(aging_filter)
+    return movers[mask]
+
+def create_movers_trend_chart(monthly_summary, title_text, selected_month):
+    trend_df = monthly_summary.reset_index().melt(id_vars='月份', var_name='異動類型', value_name='案件數量')
+    fig = px.bar(
+        trend_df, x='月份', y='案件數量', color='異動類型', barmode='group',
+        title=title_text,
+        category_orders={'異動類型': CHANGE_TYPE_ORDER},
+        color_discrete_map=CHANGE_TYPE_COLORS,
+        labels={'月份': '檢視月份', '案件數量': '案件數量', '異動類型': '異動類型'}
+    )
+    # 標示目前選擇的月份
+    fig.add_vrect(
+        x0=selected_month - pd.Timedelta(days=14), x1=selected_month + pd.Timedelta(days=14),
+        fillcolor='gray', opacity=0.15, line_width=0
+    )
+    return fig
+
 if df is not None:
     st.title("📊 租車案件帳齡追蹤報表")
     st.markdown("使用側邊欄的篩選器來查看不同案件或合約日期的帳齡變化趨勢。")
@@ -273,13 +502,14 @@ if df is not None:
     stacked_bar_mode = "案件數量" # 預設值
     heatmap_mode = "案件數量" # 預設值
     use_log_scale = False # 預設值
+    movers_ready = False # 月對月帳齡異動索引是否有可檢視的月份
 
     # --- 側邊欄篩選器 ---
     st.sidebar.header("篩選項")
 
     filter_type = st.sidebar.radio(
         "請選擇篩選方式：",
-        ('依合約日期範圍篩選', '依案件編號篩選', '依合約月份群組比較', '資產品質月變動分析'),
+        ('依合約日期範圍篩選', '依案件編號篩選', '依合約月份群組比較', '資產品質月變動分析', '帳齡移轉預測', '月對月帳齡異動'),
         help="選擇您想用來過濾資料的維度。"
     )
 
@@ -442,16 +672,103 @@ if df is not None:
         title_text = "資產品質月變動分析"
 
 
+    elif '帳齡移轉預測' in filter_type:
+        st.sidebar.markdown("以歷史帳齡的月對月移轉機率 (馬可夫鏈) 預測各合約月份資產包未來的延滯比例。")
+
+        delay_metric_options_markov = {
+            "M1+ 延滯比例": ['M1', 'M2', 'M3', 'M4', 'M5', 'M6', 'M6+'],
+            "M2+ 延滯比例": ['M2', 'M3', 'M4', 'M5', 'M6', 'M6+'],
+            "M4+ 延滯比例": ['M4', 'M5', 'M6', 'M6+'],
+            "M6+ 延滯比例": ['M6', 'M6+']
+        }
+        selected_delay_metric_name = st.sidebar.selectbox(
+            '選擇延滯指標',
+            list(delay_metric_options_markov.keys()),
+            help="選擇要預測的延滯指標。"
+        )
+        selected_delay_categories = delay_metric_options_markov[selected_delay_metric_name]
+        forecast_horizon = st.sidebar.slider("預測月數", min_value=1, max_value=24, value=6, help="從各合約月份最後一個觀測月份起，往後預測的月數。")
+        confidence_level = st.sidebar.radio("信賴區間", (90, 95), index=1, horizontal=True, format_func=lambda x: f"{x}%")
+        n_bootstrap = st.sidebar.select_slider("Bootstrap 抽樣次數", options=[200, 500, 1000, 2000], value=500, help="次數越多信賴區間越穩定，但計算時間越長。")
+
+        projection_df, transition_df = project_markov_delay(
+            df, get_data_fingerprint(), tuple(selected_delay_categories),
+            forecast_horizon, n_bootstrap, confidence_level
+        )
+
+        all_contract_months = sorted(projection_df['合約月份'].unique(), reverse=True)
+        selected_contract_months = st.sidebar.multiselect(
+            '選擇合約月份 (可多選)',
+            all_contract_months,
+            default=all_contract_months[:5],
+            help="所有合約月份都已一次預測完成，這裡只決定圖表中顯示哪些月份。"
+        )
+
+        if selected_contract_months:
+            filtered_df = projection_df[projection_df['合約月份'].isin(selected_contract_months)]
+            title_text = f"各合約月份資產包的 {selected_delay_metric_name} 預測 (未來 {forecast_horizon} 個月，{confidence_level}% 信賴區間)"
+        else:
+            filtered_df = pd.DataFrame()
+            title_text = "請選擇合約月份"
+        chart_type = "馬可夫預測圖"
+
+
+    elif '月對月帳齡異動' in filter_type:
+        st.sidebar.markdown("列出指定月份相較上個月帳齡惡化、轉正常、改善、新進或重新出現的案件。")
+
+        change_index, month_bounds, movers_summary = build_case_change_index(df, get_data_fingerprint())
+
+        movers_ready = bool(month_bounds)
+        if movers_ready:
+            movers_months = sorted(month_bounds.keys(), reverse=True)
+            selected_movers_month = st.sidebar.selectbox(
+                '選擇檢視月份 (YYYY/MM)',
+                movers_months,
+                format_func=lambda m: m.strftime('%Y/%m'),
+                help="與該月份的上一個月比較帳齡變化。"
+            )
+            selected_change_types = st.sidebar.multiselect(
+                '異動類型',
+                CHANGE_TYPE_ORDER,
+                default=CHANGE_TYPE_ORDER,
+                help="惡化：帳齡級距上升；轉正常：上月逾期 (M1 以上)、本月回到 Normal/M0；改善：帳齡級距下降但未轉正常；新進：第一次出現的案件；重新出現：上個月沒有資料、但之前曾出現過的案件 (與最後一次出現時的帳齡比較)。"
+            )
+            selected_aging_filter = st.sidebar.multiselect(
+                '本月帳齡 (可多選，不選則為全部)',
+                list(df['帳齡'].cat.categories)[::-1]
+            )
+            min_bucket_delta = st.sidebar.slider("最小帳齡變化級距", min_value=0, max_value=len(df['帳齡'].cat.categories) - 1, value=0, help="只顯示帳齡變化級距大於等於此值的案件 (新進案件的變化級距為 0)。")
+
+            filtered_df = get_month_movers(
+                change_index, month_bounds, selected_movers_month,
+                selected_change_types, selected_aging_filter, min_bucket_delta
+            )
+
+            page_size = st.sidebar.selectbox("每頁筆數", [25, 50, 100, 200], index=1)
+            n_pages = max(1, -(-len(filtered_df) // page_size))
+            page_number = st.sidebar.number_input(f"頁數 (共 {n_pages} 頁)", min_value=1, max_value=n_pages, value=1, step=1)
+            movers_page_df = filtered_df.iloc[(page_number - 1) * page_size:page_number * page_size]
+
+            title_text = f"各月份帳齡異動案件數 (目前檢視 {selected_movers_month.strftime('%Y/%m')})"
+        else:
+            filtered_df = pd.DataFrame()
+            title_text = "資料不足兩個月份，無法比較帳齡異動"
+        chart_type = "異動趨勢圖"
+
     # --- 主畫面圖表 ---
     # --- 關鍵指標 (KPIs) ---
-    if not filtered_df.empty:
+    # 月對月帳齡異動的指標與趨勢圖來自整份索引，不受側邊欄篩選結果是否為空影響
+    if not filtered_df.empty or movers_ready:
         if filter_type == '依合約月份群組比較':
             # 在同期群模式下，filtered_df 已經是聚合後的數據
             total_cases = filtered_df['總案件數'].sum()
             overdue_cases = filtered_df['延滯案件數'].sum()
             overdue_percentage = (overdue_cases / total_cases * 100) if total_cases > 0 else 0
-        elif filter_type == '資產品質月變動分析':
-            # 在資產品質月變動分析模式下，KPIs 不適用，或者需要重新定義
+        elif filter_type == '月對月帳齡異動':
+            # 在月對月帳齡異動模式下，直接使用索引中預先統計的當月各類型案件數 (不受其他篩選條件影響)
+            type_counts = movers_summary.loc[selected_movers_month]
+        elif filter_type in ('資產品質月變動分析', '帳齡移轉預測'):
+            # 在資產品質月變動分析及帳齡移轉預測模式下，KPIs 不適用，或者需要重新定義
             total_cases = "N/A"
             overdue_cases = "N/A"
             overdue_percentage = "N/A"
@@ -462,19 +779,24 @@ if df is not None:
             overdue_percentage = (overdue_cases / total_cases * 100) if total_cases > 0 else 0
 
         st.subheader("關鍵指標")
-        col1, col2, col3 = st.columns(3)
-        with col1:
-            st.metric(label="總案件數", value=total_cases)
-        with col2:
-            st.metric(label="逾期案件數 (M1+)", value=overdue_cases)
-        with col3:
-            st.metric(label="逾期案件佔比", value=f"{overdue_percentage:.2f}%" if isinstance(overdue_percentage, float) else overdue_percentage)
+        if filter_type == '月對月帳齡異動':
+            for col, change_type in zip(st.columns(len(CHANGE_TYPE_ORDER)), CHANGE_TYPE_ORDER):
+                with col:
+                    st.metric(label=f"本月{change_type}案件數", value=int(type_counts[change_type]))
+        else:
+            col1, col2, col3 = st.columns(3)
+            with col1:
+                st.metric(label="總案件數", value=total_cases)
+            with col2:
+                st.metric(label="逾期案件數 (M1+)", value=overdue_cases)
+            with col3:
+                st.metric(label="逾期案件佔比", value=f"{overdue_percentage:.2f}%" if isinstance(overdue_percentage, float) else overdue_percentage)
     else:
         st.info("請選擇篩選條件以顯示關鍵指標。")
 
-    if not filtered_df.empty:
-        # 只有在非資產品質月變動分析模式下才需要排序月份
-        if filter_type != '資產品質月變動分析':
+    if not filtered_df.empty or movers_ready:
+        # 只有在非資產品質月變動分析模式下才需要排序月份 (月對月帳齡異動的索引已預先排序)
+        if filter_type not in ('資產品質月變動分析', '月對月帳齡異動'):
             filtered_df = filtered_df.sort_values(by='月份')
 
         # 【核心修正】定義兩套Y軸順序，以應對不同圖表的邏輯
@@ -516,11 +838,15 @@ if df is not None:
             fig = create_deterioration_boxplot(filtered_df, selected_delay_metric_name_deterioration)
         elif chart_type == "熱力圖" and '資產品質月變動分析' in filter_type:
             fig = create_deterioration_heatmap(filtered_df, selected_delay_metric_name_deterioration)
+        elif chart_type == "馬可夫預測圖":
+            fig = create_markov_projection_chart(filtered_df, title_text, selected_delay_metric_name, confidence_level)
+        elif chart_type == "異動趨勢圖":
+            fig = create_movers_trend_chart(movers_summary, title_text, selected_movers_month)
 
         fig.update_layout(
             xaxis_title="<b>檢視月份</b>" if filter_type != '資產品質月變動分析' else "<b>月份</b>",
-            yaxis_title="<b>案件數量</b>" if chart_type == "堆疊長條圖" else (
-                "<b>" + selected_delay_metric_name + "</b>" if chart_type == "同期群折線圖" else (
+            yaxis_title="<b>案件數量</b>" if chart_type in ("堆疊長條圖", "異動趨勢圖") else (
+                "<b>" + selected_delay_metric_name + "</b>" if chart_type in ("同期群折線圖", "馬可夫預測圖") else (
                     "<b>" + selected_delay_metric_name_deterioration + " 逾期比例變化 (%)</b>" if filter_type == '資產品質月變動分析' else "<b>帳齡分類</b>"
                 )
             ),
@@ -530,9 +856,26 @@ if df is not None:
 
         st.plotly_chart(fig, use_container_width=True)
 
+        if chart_type == "馬可夫預測圖":
+            with st.expander("查看帳齡月移轉機率矩陣 (%)"):
+                st.markdown("列為本月帳齡，欄為下個月帳齡；沒有歷史資料的帳齡假設維持原狀。")
+                st.dataframe(transition_df.style.format("{:.1f}"))
+
+        if chart_type == "異動趨勢圖":
+            st.subheader(f"{selected_movers_month.strftime('%Y/%m')} 帳齡異動案件")
+            if filtered_df.empty:
+                st.info("此月份沒有符合篩選條件的異動案件，請嘗試不同的篩選項。")
+            else:
+                st.caption(f"共 {len(filtered_df)} 筆，顯示第 {page_number} / {n_pages} 頁。帳齡變化為與前次帳齡相比的級距，正數代表惡化，負數代表改善。")
+                st.dataframe(movers_page_df, hide_index=True, use_container_width=True)
+
         with st.expander("查看篩選後的原始資料"):
             if chart_type == "同期群折線圖":
                 st.dataframe(filtered_df.sort_values(by=['合約月份', '月份']))
+            elif chart_type == "馬可夫預測圖":
+                st.dataframe(filtered_df.sort_values(by=['合約月份', '預測月數']))
+            elif chart_type == "異動趨勢圖":
+                st.dataframe(filtered_df)
             elif filter_type == '資產品質月變動分析':
                 st.dataframe(filtered_df.sort_values(by=['年份', '月份數字']))
             else:
@@ -1,5 +1,10 @@
 import pandas as pd
 import os
+import sys
+import json
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 # --- 請根據您的情況修改以下設定 ---
 
@@ -29,9 +34,132 @@ final_col_contract_date = '合約日期'
 final_col_month = '月份'
 final_col_status = '帳齡'
 
+# 7. 批次模式：同時讀取 Excel 檔案的工作執行緒數量 (所有資產組合共用)
+batch_max_workers = 4
+
+# 8. 批次模式：整體執行摘要的預設檔名
+batch_summary_file = 'batch_run_summary.csv'
+
 
 # --- 腳本主體 ---
 
+def read_master_file(file_path):
+    """讀取底稿 Excel 檔案 (原始內容，不做任何轉換)。"""
+    return pd.read_excel(file_path, engine='openpyxl')
+
+
+def read_monthly_file(file_path):
+    """讀取月份報告，並指定第二列 (index=1) 為欄位名稱列。"""
+    monthly_df = pd.read_excel(file_path, engine='openpyxl', header=1)
+
+    # 處理可能重複的欄位名稱
+    if monthly_df.columns.duplicated().any():
+        monthly_df = monthly_df.loc[:, ~monthly_df.columns.duplicated()]
+    return monthly_df
+
+
+def prepare_master_df(master_df, master_file, case_id_col, contract_date_col, log=print):
+    """
+    整理底稿：轉換合約日期格式、去除重複案件，並將案件編號轉為字串。
+    不會修改傳入的 DataFrame (批次模式下多個資產組合可能共用同一份底稿)。
+    找不到必要欄位時回傳 None。
+    """
+    # 確保指定的欄位存在
+    if case_id_col not in master_df.columns or contract_date_col not in master_df.columns:
+        log(f"錯誤：底稿 '{master_file}' 中找不到 '{case_id_col}' 或 '{contract_date_col}' 欄位。")
+        return None
+
+    master_df = master_df[[case_id_col, contract_date_col]].copy()
+
+    # 將合約日期轉換為 YYYY/MM 格式
+    try:
+        # 根據使用者提供的 YYYYMM 格式來解析日期
+        master_df[contract_date_col] = pd.to_datetime(master_df[contract_date_col], format='%Y%m', errors='coerce')
+        # 移除無法成功解析日期的資料行
+        master_df.dropna(subset=[contract_date_col], inplace=True)
+        # 將日期格式化為 YYYY/MM
+        master_df[contract_date_col] = master_df[contract_date_col].dt.strftime('%Y/%m')
+        log("成功將合約日期轉換為 YYYY/MM 格式。")
+    except Exception as e:
+        log(f"警告：轉換合約日期格式時發生錯誤: {e}。將保留原始格式。")
+
+    # 只保留案件編號和合約日期，並移除重複的案件
+    master_df = master_df.drop_duplicates(subset=[case_id_col])
+
+    # 【核心修改】確保案件編號為字串格式，以利比對
+    master_df[case_id_col] = master_df[case_id_col].astype(str)
+    return master_df
+
+
+def list_monthly_files(folder):
+    """取得所有月份報告的檔名，並排除Excel暫存檔(以~$開頭)。"""
+    return sorted(f for f in os.listdir(folder) if f.endswith(('.xlsx', '.xls')) and not f.startswith('~$'))
+
+
+def month_name_from_file(file_name):
+    """從檔名中擷取月份，並將格式從 YYYYMM 轉為 YYYY/MM。"""
+    month_name_raw = os.path.basename(file_name).split('_')[0]
+    if len(month_name_raw) == 6 and month_name_raw.isdigit():
+        return f"{month_name_raw[:4]}/{month_name_raw[4:]}"
+    return month_name_raw # 如果格式不符，保留原始名稱
+
+
+def extract_monthly_subset(monthly_df, file_name, valid_case_ids, case_id_col,
+                           monthly_case_id_col, monthly_status_col, log=print):
+    """
+    從單一月份報告中，篩選出底稿內的案件，並整理成 (案件編號, 帳齡, 月份) 三個欄位。
+    欄位缺少或篩選後沒有資料時回傳 None。
+    """
+    month_name = month_name_from_file(file_name)
+    log(f"正在處理檔案: {file_name}，月份設為: {month_name}")
+
+    # 確保月份報告中有必要的欄位
+    if monthly_case_id_col not in monthly_df.columns or monthly_status_col not in monthly_df.columns:
+        log(f"警告：檔案 '{file_name}' 中找不到 '{monthly_case_id_col}' 或 '{monthly_status_col}' 欄位，將跳過此檔案。")
+        return None
+
+    # 【核心修改】只保留存在於底稿案件列表中的資料
+    original_count = len(monthly_df)
+    monthly_df = monthly_df[monthly_df[monthly_case_id_col].isin(valid_case_ids)]
+    filtered_count = len(monthly_df)
+    if original_count > 0:
+        log(f"  -> 篩選結果: 在 {original_count} 筆資料中，找到 {filtered_count} 筆符合底稿的案件。")
+
+    # 如果篩選後沒有資料，則跳過此檔案
+    if monthly_df.empty:
+        return None
+
+    # 篩選所需欄位並移除空值
+    monthly_subset = monthly_df[[monthly_case_id_col, monthly_status_col]].dropna().copy()
+
+    # 新增月份欄位
+    monthly_subset[final_col_month] = month_name
+
+    # 重新命名欄位以進行合併
+    return monthly_subset.rename(columns={
+        monthly_case_id_col: case_id_col,
+        monthly_status_col: final_col_status
+    })
+
+
+def assemble_long_report(all_months_data, master_df, case_id_col, contract_date_col):
+    """將所有月份的資料合併，加入合約日期，並整理成最終報表的欄位。"""
+    # 將所有月份的資料合併成一個大的 DataFrame
+    final_df = pd.concat(all_months_data, ignore_index=True)
+
+    # 將月份資料與底稿合併，以加入合約日期
+    final_df = pd.merge(final_df, master_df, on=case_id_col, how='left')
+
+    # 重新排列欄位順序
+    final_df = final_df[[case_id_col, contract_date_col, final_col_month, final_col_status]]
+
+    # 重新命名最終的欄位
+    return final_df.rename(columns={
+        case_id_col: final_col_case_id,
+        contract_date_col: final_col_contract_date
+    })
+
+
 def generate_long_report():
     """
     讀取底稿和各月份報告，合併成一張垂直格式的總表。
@@ -39,38 +167,18 @@ def generate_long_report():
     """
     try:
         # 讀取底稿 (案件編號、合約日期)
-        master_df = pd.read_excel(master_list_file, engine='openpyxl')
+        master_df = read_master_file(master_list_file)
         print(f"成功讀取底稿檔案: {master_list_file}")
 
-        # 確保指定的欄位存在
-        if case_id_col not in master_df.columns or contract_date_col not in master_df.columns:
-            print(f"錯誤：底稿 '{master_list_file}' 中找不到 '{case_id_col}' 或 '{contract_date_col}' 欄位。")
+        master_df = prepare_master_df(master_df, master_list_file, case_id_col, contract_date_col)
+        if master_df is None:
             return
 
-        # 將合約日期轉換為 YYYY/MM 格式
-        try:
-            # 根據使用者提供的 YYYYMM 格式來解析日期
-            master_df[contract_date_col] = pd.to_datetime(master_df[contract_date_col], format='%Y%m', errors='coerce')
-            # 移除無法成功解析日期的資料行
-            master_df.dropna(subset=[contract_date_col], inplace=True)
-            # 將日期格式化為 YYYY/MM
-            master_df[contract_date_col] = master_df[contract_date_col].dt.strftime('%Y/%m')
-            print("成功將合約日期轉換為 YYYY/MM 格式。")
-        except Exception as e:
-            print(f"警告：轉換合約日期格式時發生錯誤: {e}。將保留原始格式。")
-
-        # 只保留案件編號和合約日期，並移除重複的案件
-        master_df = master_df[[case_id_col, contract_date_col]].drop_duplicates(subset=[case_id_col])
-
-        # 【核心修改】確保案件編號為字串格式，以利比對
-        master_df[case_id_col] = master_df[case_id_col].astype(str)
-
         # 取得要在報告中包含的案件編號列表，使用 set 以加快查詢速度
         valid_case_ids = set(master_df[case_id_col])
         print(f"成功從底稿讀取 {len(valid_case_ids)} 個不重複的案件編號進行處理。")
 
-        # 取得所有月份報告的檔案路徑，並排除Excel暫存檔(以~$開頭)
-        monthly_files = [f for f in os.listdir(monthly_reports_folder) if f.endswith(('.xlsx', '.xls')) and not f.startswith('~$')]
+        monthly_files = list_monthly_files(monthly_reports_folder)
 
         if not monthly_files:
             print(f"錯誤：在資料夾 '{monthly_reports_folder}' 中找不到任何 Excel 檔案。")
@@ -81,89 +189,306 @@ def generate_long_report():
         all_months_data = []
 
         # 逐一讀取並處理月份報告
-        for file_name in sorted(monthly_files):
+        for file_name in monthly_files:
             file_path = os.path.join(monthly_reports_folder, file_name)
 
             try:
-                # 從檔名中擷取月份
-                month_name_raw = os.path.basename(file_name).split('_')[0]
+                monthly_df = read_monthly_file(file_path)
+                monthly_subset = extract_monthly_subset(
+                    monthly_df, file_name, valid_case_ids, case_id_col,
+                    monthly_case_id_col, monthly_status_col
+                )
+                if monthly_subset is not None:
+                    all_months_data.append(monthly_subset)
 
-                # 將月份格式從 YYYYMM 轉為 YYYY/MM
-                if len(month_name_raw) == 6 and month_name_raw.isdigit():
-                    month_name = f"{month_name_raw[:4]}/{month_name_raw[4:]}"
-                else:
-                    month_name = month_name_raw # 如果格式不符，保留原始名稱
+            except Exception as e:
+                print(f"處理檔案 {file_name} 時發生錯誤: {e}")
 
-                print(f"正在處理檔案: {file_name}，月份設為: {month_name}")
+        if not all_months_data:
+            print("沒有成功處理任何月份的資料，無法產生報表。")
+            return
 
-                # 讀取月份報告，並指定第二列 (index=1) 為欄位名稱列
-                monthly_df = pd.read_excel(file_path, engine='openpyxl', header=1)
+        final_df = assemble_long_report(all_months_data, master_df, case_id_col, contract_date_col)
 
-                # 處理可能重複的欄位名稱
-                if monthly_df.columns.duplicated().any():
-                    monthly_df = monthly_df.loc[:, ~monthly_df.columns.duplicated()]
+        # 儲存最終的合併報表
+        final_df.to_csv(output_file, index=False, encoding='utf-8-sig')
+        print(f"\n報表產生完成！已儲存至: {os.path.abspath(output_file)}")
 
-                # 確保月份報告中有必要的欄位
-                if monthly_case_id_col not in monthly_df.columns or monthly_status_col not in monthly_df.columns:
-                    print(f"警告：檔案 '{file_name}' 中找不到 '{monthly_case_id_col}' 或 '{monthly_status_col}' 欄位，將跳過此檔案。")
-                    continue
+    except FileNotFoundError:
+        print(f"錯誤：找不到指定的底稿檔案 '{master_list_file}'。請檢查路徑是否正確。")
+    except Exception as e:
+        print(f"發生未預期的錯誤: {e}")
 
-                # 【核心修改】只保留存在於底稿案件列表中的資料
-                original_count = len(monthly_df)
-                monthly_df = monthly_df[monthly_df[monthly_case_id_col].isin(valid_case_ids)]
-                filtered_count = len(monthly_df)
-                if original_count > 0:
-                    print(f"  -> 篩選結果: 在 {original_count} 筆資料中，找到 {filtered_count} 筆符合底稿的案件。")
 
-                # 如果篩選後沒有資料，則跳過此檔案
-                if monthly_df.empty:
-                    continue
+# --- 批次模式：依設定檔一次處理多個資產組合 ---
 
-                # 篩選所需欄位並移除空值
-                monthly_subset = monthly_df[[monthly_case_id_col, monthly_status_col]].dropna()
+class SharedFileReader:
+    """
+    批次模式下所有資產組合共用的檔案讀取器。
+    同一個檔案 (以絕對路徑判斷) 在整次執行中只會被讀取一次，
+    讀取工作交由共用的執行緒池處理，其他需要相同檔案的資產組合會直接等待同一個結果。
+    各資產組合須先以 register() 登記會用到的檔案，處理完後以 release() 歸還；
+    最後一個使用者歸還後即釋放該檔案的內容，避免所有月份報告同時留在記憶體中。
+    回傳的 DataFrame 為共用物件，呼叫端不可直接修改。
+    """
 
-                # 新增月份欄位
-                monthly_subset[final_col_month] = month_name
+    def __init__(self, executor):
+        self._executor = executor
+        self._futures = {}
+        self._consumers = {}
+        self._lock = threading.Lock()
+        self.files_read = 0
+
+    @staticmethod
+    def _key(reader, file_path):
+        return (reader.__name__, os.path.abspath(file_path))
+
+    def register(self, reader, file_path):
+        key = self._key(reader, file_path)
+        with self._lock:
+            self._consumers[key] = self._consumers.get(key, 0) + 1
+
+    def get(self, reader, file_path):
+        key = self._key(reader, file_path)
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._executor.submit(reader, file_path)
+                self._futures[key] = future
+                self.files_read += 1
+        return future
+
+    def release(self, reader, file_path):
+        key = self._key(reader, file_path)
+        with self._lock:
+            remaining = self._consumers.get(key, 0) - 1
+            if remaining > 0:
+                self._consumers[key] = remaining
+            else:
+                self._consumers.pop(key, None)
+                self._futures.pop(key, None)
+
+
+def load_batch_config(config_path):
+    """
+    讀取批次設定檔 (JSON)，回傳 (執行設定, 資產組合設定列表)。
+    每個資產組合的設定會依序套用：腳本預設值 -> 設定檔中的 defaults -> 該組合自己的設定。
+    相對路徑一律以設定檔所在的資料夾為基準。
+    """
+    with open(config_path, encoding='utf-8-sig') as f:
+        config = json.load(f)
+
+    config_dir = os.path.dirname(os.path.abspath(config_path))
+
+    def resolve(path):
+        return path if os.path.isabs(path) else os.path.join(config_dir, path)
+
+    base_settings = {
+        'case_id_col': case_id_col,
+        'contract_date_col': contract_date_col,
+        'monthly_case_id_col': monthly_case_id_col,
+        'monthly_status_col': monthly_status_col,
+    }
+    base_settings.update(config.get('defaults', {}))
+
+    portfolios = []
+    seen_names = set()
+    for entry in config.get('portfolios', []):
+        settings = dict(base_settings)
+        settings.update(entry)
+
+        name = settings.get('name')
+        if not name:
+            raise ValueError("設定檔中的每個資產組合都必須有 'name' 欄位。")
+        if name in seen_names:
+            raise ValueError(f"設定檔中的資產組合名稱 '{name}' 重複。")
+        seen_names.add(name)
+
+        for key in ('monthly_reports_folder', 'master_list_file'):
+            if not settings.get(key):
+                raise ValueError(f"資產組合 '{name}' 缺少 '{key}' 設定。")
+            settings[key] = resolve(settings[key])
+        settings['output_file'] = resolve(settings.get('output_file') or f'consolidated_report_long_{name}.csv')
+        portfolios.append(settings)
+
+    if not portfolios:
+        raise ValueError(f"設定檔 '{config_path}' 中沒有任何資產組合 (portfolios)。")
+
+    run_settings = {
+        'max_workers': int(config.get('max_workers', batch_max_workers)),
+        'summary_file': resolve(config.get('summary_file', batch_summary_file)),
+    }
+
+    # 輸出檔案不可重複，否則多個執行緒會同時寫入同一個檔案
+    seen_outputs = {os.path.normcase(os.path.abspath(run_settings['summary_file'])): '執行摘要 (summary_file)'}
+    for settings in portfolios:
+        output_key = os.path.normcase(os.path.abspath(settings['output_file']))
+        if output_key in seen_outputs:
+            raise ValueError(f"資產組合 '{settings['name']}' 的輸出檔案 '{settings['output_file']}' 與 {seen_outputs[output_key]} 重複。")
+        seen_outputs[output_key] = f"資產組合 '{settings['name']}'"
+
+    return run_settings, portfolios
+
+
+def register_portfolio_files(settings, shared_reader):
+    """
+    列出資產組合的月份檔案，並向共用讀取器登記底稿與月份檔案。
+    須在所有資產組合開始處理前完成，才能確保共用的檔案只讀取一次。
+    無法列出資料夾時回傳該錯誤，留待 run_portfolio 記錄到執行摘要。
+    """
+    try:
+        monthly_files = list_monthly_files(settings['monthly_reports_folder'])
+    except OSError as e:
+        return e
 
-                # 重新命名欄位以進行合併
-                monthly_subset = monthly_subset.rename(columns={
-                    monthly_case_id_col: case_id_col,
-                    monthly_status_col: final_col_status
-                })
+    shared_reader.register(read_master_file, settings['master_list_file'])
+    for file_name in monthly_files:
+        shared_reader.register(read_monthly_file, os.path.join(settings['monthly_reports_folder'], file_name))
+    return monthly_files
 
-                all_months_data.append(monthly_subset)
 
-            except Exception as e:
-                print(f"處理檔案 {file_name} 時發生錯誤: {e}")
+def run_portfolio(settings, monthly_files, shared_reader, prefetch):
+    """
+    處理單一資產組合，回傳一行執行摘要 (dict)。
+    monthly_files 為 register_portfolio_files 的結果；月份報告最多預先讀取 prefetch 個檔案。
+    """
+    name = settings['name']
+    started = time.perf_counter()
+    summary = {
+        '資產組合': name,
+        '狀態': '失敗',
+        '底稿案件數': 0,
+        '月份檔案數': 0,
+        '成功處理月份數': 0,
+        '輸出筆數': 0,
+        '輸出檔案': settings['output_file'],
+        '訊息': '',
+        '耗時(秒)': 0.0,
+    }
+
+    def log(message):
+        print(f"[{name}] {message}")
+
+    # 尚未歸還給共用讀取器的檔案，結束時 (包含發生錯誤時) 一併歸還
+    pending = []
 
-        if not all_months_data:
-            print("沒有成功處理任何月份的資料，無法產生報表。")
-            return
+    try:
+        if isinstance(monthly_files, Exception):
+            raise monthly_files
+
+        summary['月份檔案數'] = len(monthly_files)
+        monthly_paths = [os.path.join(settings['monthly_reports_folder'], f) for f in monthly_files]
+        pending = [(read_master_file, settings['master_list_file'])] + [(read_monthly_file, path) for path in monthly_paths]
+
+        # 先送出前幾個月份檔案的讀取工作，讓底稿與月份報告可以同時讀取
+        for path in monthly_paths[:prefetch]:
+            shared_reader.get(read_monthly_file, path)
+
+        raw_master_df = shared_reader.get(read_master_file, settings['master_list_file']).result()
+        log(f"成功讀取底稿檔案: {settings['master_list_file']}")
+        master_df = prepare_master_df(
+            raw_master_df, settings['master_list_file'],
+            settings['case_id_col'], settings['contract_date_col'], log=log
+        )
+        del raw_master_df
+        shared_reader.release(*pending.pop(0))
+        if master_df is None:
+            summary['訊息'] = '底稿缺少必要欄位'
+            return summary
+
+        valid_case_ids = set(master_df[settings['case_id_col']])
+        summary['底稿案件數'] = len(valid_case_ids)
+        log(f"成功從底稿讀取 {len(valid_case_ids)} 個不重複的案件編號進行處理。")
 
-        # 將所有月份的資料合併成一個大的 DataFrame
-        final_df = pd.concat(all_months_data, ignore_index=True)
+        if not monthly_files:
+            summary['訊息'] = '找不到任何月份 Excel 檔案'
+            log(f"錯誤：在資料夾 '{settings['monthly_reports_folder']}' 中找不到任何 Excel 檔案。")
+            return summary
 
-        # 將月份資料與底稿合併，以加入合約日期
-        final_df = pd.merge(final_df, master_df, on=case_id_col, how='left')
+        all_months_data = []
+        for i, (file_name, path) in enumerate(zip(monthly_files, monthly_paths)):
+            # 維持固定數量的預先讀取，處理完的檔案立即歸還
+            if i + prefetch < len(monthly_paths):
+                shared_reader.get(read_monthly_file, monthly_paths[i + prefetch])
+            try:
+                monthly_subset = extract_monthly_subset(
+                    shared_reader.get(read_monthly_file, path).result(), file_name, valid_case_ids, settings['case_id_col'],
+                    settings['monthly_case_id_col'], settings['monthly_status_col'], log=log
+                )
+                if monthly_subset is not None:
+                    all_months_data.append(monthly_subset)
+            except Exception as e:
+                log(f"處理檔案 {file_name} 時發生錯誤: {e}")
+            finally:
+                shared_reader.release(*pending.pop(0))
 
-        # 重新排列欄位順序
-        final_df = final_df[[case_id_col, contract_date_col, final_col_month, final_col_status]]
+        summary['成功處理月份數'] = len(all_months_data)
+        if not all_months_data:
+            summary['訊息'] = '沒有成功處理任何月份的資料'
+            log("沒有成功處理任何月份的資料，無法產生報表。")
+            return summary
+
+        final_df = assemble_long_report(
+            all_months_data, master_df, settings['case_id_col'], settings['contract_date_col']
+        )
+        final_df.to_csv(settings['output_file'], index=False, encoding='utf-8-sig')
+        log(f"報表產生完成！已儲存至: {os.path.abspath(settings['output_file'])}")
+
+        summary['狀態'] = '成功'
+        summary['輸出筆數'] = len(final_df)
+
+    except FileNotFoundError as e:
+        summary['訊息'] = f"找不到檔案或資料夾: {e.filename or e}"
+        log(f"錯誤：{summary['訊息']}。請檢查路徑是否正確。")
+    except Exception as e:
+        summary['訊息'] = str(e)
+        log(f"發生未預期的錯誤: {e}")
+    finally:
+        for reader, path in pending:
+            shared_reader.release(reader, path)
+        summary['耗時(秒)'] = round(time.perf_counter() - started, 2)
 
-        # 重新命名最終的欄位
-        final_df = final_df.rename(columns={
-            case_id_col: final_col_case_id,
-            contract_date_col: final_col_contract_date
-        })
+    return summary
 
-        # 儲存最終的合併報表
-        final_df.to_csv(output_file, index=False, encoding='utf-8-sig')
-        print(f"\n報表產生完成！已儲存至: {os.path.abspath(output_file)}")
 
-    except FileNotFoundError:
-        print(f"錯誤：找不到指定的底稿檔案 '{master_list_file}'。請檢查路徑是否正確。")
-    except Exception as e:
-        print(f"發生未預期的錯誤: {e}")
+def run_batch(config_path):
+    """
+    依設定檔批次產生多個資產組合的報表。
+    所有資產組合同時處理，並共用同一個讀檔執行緒池；相同的底稿或月份檔案只會讀取一次。
+    每個資產組合各自輸出一份長表，並另外輸出一份整體執行摘要。
+    """
+    try:
+        run_settings, portfolios = load_batch_config(config_path)
+    except (OSError, ValueError) as e:
+        print(f"錯誤：無法讀取批次設定檔 '{config_path}': {e}")
+        return None
+
+    print(f"共 {len(portfolios)} 個資產組合，使用 {run_settings['max_workers']} 個讀檔執行緒。")
+
+    # 讀檔工作與資產組合工作分別使用不同的執行緒池，
+    # 避免資產組合在等待讀檔結果時佔滿讀檔執行緒而互相卡住。
+    with ThreadPoolExecutor(max_workers=run_settings['max_workers'], thread_name_prefix='reader') as io_executor, \
+         ThreadPoolExecutor(max_workers=len(portfolios), thread_name_prefix='portfolio') as portfolio_executor:
+        shared_reader = SharedFileReader(io_executor)
+        monthly_files_by_portfolio = [register_portfolio_files(settings, shared_reader) for settings in portfolios]
+        summaries = list(portfolio_executor.map(
+            lambda settings, monthly_files: run_portfolio(settings, monthly_files, shared_reader, run_settings['max_workers']),
+            portfolios, monthly_files_by_portfolio
+        ))
+
+    summary_df = pd.DataFrame(summaries)
+    summary_df.to_csv(run_settings['summary_file'], index=False, encoding='utf-8-sig')
+
+    succeeded = (summary_df['狀態'] == '成功').sum()
+    print(f"\n批次執行完成：{succeeded}/{len(summary_df)} 個資產組合成功，共讀取 {shared_reader.files_read} 個不重複的檔案。")
+    print(f"執行摘要已儲存至: {os.path.abspath(run_settings['summary_file'])}")
+    return summary_df
 
 # 執行函式
+# 不帶參數時維持原本的單一報表模式；帶入設定檔路徑時改用批次模式，例如：
+#   python 程式碼.py portfolios.json
 if __name__ == "__main__":
-    generate_long_report()
+    if len(sys.argv) > 1:
+        run_batch(sys.argv[1])
+    else:
+        generate_long_report()